@@ -553,6 +553,12 @@ def test_validate_data_sets_args_filtering_ko(config):
             },
         ],
     }),
+    ({  # Basic config - optional brief
+        "name": "SrcA",
+        "app": "dcim",
+        "type": "devices",
+        "brief": True,
+    }),
 ])
 def test_validate_data_sets_args_netbox_source(config):
     Validator.DataSets.validate_data_set_args(
@@ -323,7 +323,8 @@ def test_index_elements_dict_index():
                 "children": [],
                 "hosts": [
                     "elt1"
-                ]
+                ],
+                "_hosts_set": {"elt1"}
             }
         }
     ),
@@ -342,7 +343,8 @@ def test_index_elements_dict_index():
                 "children": [],
                 "hosts": [
                     "elt1"
-                ]
+                ],
+                "_hosts_set": {"elt1"}
             }
         }
     ),
@@ -364,7 +366,8 @@ def test_index_elements_dict_index():
                 "hosts": [
                     "elt2",
                     "elt1"
-                ]
+                ],
+                "_hosts_set": {"elt2", "elt1"}
             }
         }
     ),
@@ -385,7 +388,8 @@ def test_index_elements_dict_index():
                 "children": [],
                 "hosts": [
                     "elt1"
-                ]
+                ],
+                "_hosts_set": {"elt1"}
             },
             "grp2": {
                 "vars": {},
@@ -420,7 +424,8 @@ def test_index_elements_dict_index():
                 "children": [],
                 "hosts": [
                     "elt1"
-                ]
+                ],
+                "_hosts_set": {"elt1"}
             },
             "grp2": {
                 "vars": {},
@@ -440,6 +445,27 @@ def test_add_element_to_group(element_name, group_name, inventory, expected):
     ) == expected
 
 
+def test_strip_host_sets():
+    inventory = {
+        "_meta": {"hostvars": {}},
+        "grp1": {
+            "vars": {},
+            "children": [],
+            "hosts": ["elt1"],
+            "_hosts_set": {"elt1"}
+        }
+    }
+
+    assert InventoryRenderer.Utils.strip_host_sets(inventory) == {
+        "_meta": {"hostvars": {}},
+        "grp1": {
+            "vars": {},
+            "children": [],
+            "hosts": ["elt1"]
+        }
+    }
+
+
 @pytest.mark.parametrize("indexed_data_set, group_by, inventory, expected", [
     (  # Empty group by
         {},
@@ -466,14 +492,16 @@ def test_add_element_to_group(element_name, group_name, inventory, expected):
                 "children": [],
                 "hosts": [
                     "1"
-                ]
+                ],
+                "_hosts_set": {"1"}
             },
             "_2": {
                 "vars": {},
                 "children": [],
                 "hosts": [
                     "2"
-                ]
+                ],
+                "_hosts_set": {"2"}
             },
         }
     ),
@@ -496,7 +524,8 @@ def test_add_element_to_group(element_name, group_name, inventory, expected):
                 "children": [],
                 "hosts": [
                     "1", "2"
-                ]
+                ],
+                "_hosts_set": {"1", "2"}
             },
         }
     ),
@@ -521,7 +550,8 @@ def test_add_element_to_group(element_name, group_name, inventory, expected):
                 "children": [],
                 "hosts": [
                     "1", "2"
-                ]
+                ],
+                "_hosts_set": {"1", "2"}
             },
         }
     ),
@@ -549,7 +579,8 @@ def test_add_element_to_group(element_name, group_name, inventory, expected):
                 "children": [],
                 "hosts": [
                     "1", "2"
-                ]
+                ],
+                "_hosts_set": {"1", "2"}
             },
         }
     ),
@@ -577,14 +608,16 @@ def test_add_element_to_group(element_name, group_name, inventory, expected):
                 "children": [],
                 "hosts": [
                     "1", "2"
-                ]
+                ],
+                "_hosts_set": {"1", "2"}
             },
             "_2": {
                 "vars": {},
                 "children": [],
                 "hosts": [
                     "1"
-                ]
+                ],
+                "_hosts_set": {"1"}
             },
         }
     ),
@@ -617,21 +650,24 @@ def test_add_element_to_group(element_name, group_name, inventory, expected):
                 "children": [],
                 "hosts": [
                     "1", "2"
-                ]
+                ],
+                "_hosts_set": {"1", "2"}
             },
             "_2": {
                 "vars": {},
                 "children": [],
                 "hosts": [
                     "1"
-                ]
+                ],
+                "_hosts_set": {"1"}
             },
             "_grpA": {
                 "vars": {},
                 "children": [],
                 "hosts": [
                     "3"
-                ]
+                ],
+                "_hosts_set": {"3"}
             },
         }
     ),
@@ -1,9 +1,88 @@
+import json
+
 import pytest
 from yaani.yaani import (
-    Utils
+    Utils,
+    compile_query,
+    simple_key_path,
+    walk_key_path
 )
 
 
+def test_compile_query():
+    program = compile_query(".a")
+
+    assert program.first({"a": 1}) == 1
+    # The same query string must reuse the cached program
+    assert compile_query(".a") is program
+
+
+def test_compile_query_bad_query():
+    with pytest.raises(ValueError):
+        compile_query(".[")
+
+
+@pytest.mark.parametrize("query,expected", [
+    (".a", ["a"]),  # Single key
+    (".a.b_c", ["a", "b_c"]),  # Nested keys
+    (".a[0]", None),  # Indexing goes through jq
+    (".a | .b", None),  # Piping goes through jq
+    (".a?", None),  # Optional access goes through jq
+    (".", None),  # Identity goes through jq
+    ("", None),  # Empty query goes through jq
+])
+def test_simple_key_path(query, expected):
+    assert simple_key_path(query) == expected
+
+
+@pytest.mark.parametrize("keys,data,expected", [
+    (["a"], {"a": 1}, 1),  # Single key
+    (["a", "b"], {"a": {"b": 2}}, 2),  # Nested keys
+    (["b"], {"a": 1}, None),  # Missing key
+    (["a", "b"], {"a": None}, None),  # Null intermediate value
+    (["a"], None, None),  # Null data
+])
+def test_walk_key_path(keys, data, expected):
+    assert walk_key_path(keys, data) == expected
+
+
+def test_walk_key_path_bad_data():
+    with pytest.raises(TypeError):
+        walk_key_path(["a", "b"], {"a": 1})
+
+
+def test_dump_json_inventory_non_str_keys(capsys):
+    # An integer index query such as ".id" yields integer hostvar keys;
+    # they must be dumped as strings whichever json backend is used
+    inventory = {
+        "_meta": {
+            "hostvars": {
+                123: {"id": 123}
+            }
+        },
+        "group1": {
+            "hosts": ["123"],
+            "vars": {},
+            "children": [],
+        },
+    }
+
+    Utils.dump_json_inventory(inventory)
+
+    assert json.loads(capsys.readouterr().out) == {
+        "_meta": {
+            "hostvars": {
+                "123": {"id": 123}
+            }
+        },
+        "group1": {
+            "hosts": ["123"],
+            "vars": {},
+            "children": [],
+        },
+    }
+
+
 @pytest.mark.parametrize("args,exp", [
     (['-c', 'test.yml', '--list'], {  # config file plus list
         "config-file": "test.yml",
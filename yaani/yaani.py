@@ -1,11 +1,13 @@
 #!/usr/bin/env python3
 from __future__ import absolute_import
 
-from functools import reduce
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from abc import ABC, abstractmethod
 import requests
 import argparse
 import sys
+import re
 import os
 import yaml
 import importlib.util
@@ -14,7 +16,19 @@ try:
 except ImportError:
     import simplejson as json
 
-from jsonschema import validate
+try:
+    # The C accelerated loader is only there when PyYAML was built
+    # against libyaml
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from jsonschema import Draft7Validator
 from jsonschema.exceptions import ValidationError
 import pynetbox
 from pynetbox.core.query import RequestError
@@ -26,1029 +40,1162 @@ DEFAULT_ENV_CONFIG_FILE = "YAANI_CONFIG_FILE"
 DEFAULT_ENV_MODULES_DIR = "YAANI_MODULES_PATH"
 
 
+@lru_cache(maxsize=4096)
+def compile_query(query):
+    """Compile a jq query into a reusable program.
+
+    The same queries (pivots, conditions, host vars definitions) come
+    straight from the configuration file and are evaluated over and over
+    during a rendering, so the compiled programs are cached per query
+    string and built only once per process.
+
+    Args:
+        query (str): The jq query
+
+    Raises:
+        ValueError: Raise an exception if the query cannot be compiled.
+    """
+    return pyjq.compile(query)
+
+
+# A jq query that is nothing more than a dotted key path ('.a.b_c')
+SIMPLE_KEY_PATH_RE = re.compile(r'^(?:\.[A-Za-z_][A-Za-z0-9_]*)+$')
+
+# The jq program templates wrapping user queries. The formatted results
+# only get compiled once each thanks to compile_query()
+MAP_QUERY_TEMPLATE = "[ .[] | [.[0], (.[1]{})]]"
+CONDITION_QUERY_TEMPLATE = "[ .[] | select(.[1]{}) | .[0] ]"
+HOST_VARS_QUERY_TEMPLATE = "[ .[] | [.[0], (.[1] | {%s}) ]]"
+INDEX_QUERY_TEMPLATE = "[ .[] | [.[0], (.[1]{})] ]"
+GROUP_BY_QUERY_TEMPLATE = "[ .[] | [.[0], (.[1] | [{}] | flatten)]]"
+
+
+def simple_key_path(query):
+    """Return the key list of a plain dotted-path jq query
+    ('.a.b' gives ['a', 'b']), or None when the query uses any other jq
+    construct and has to go through the jq engine.
+
+    Args:
+        query (str): The jq query
+    """
+    if SIMPLE_KEY_PATH_RE.match(query):
+        return query[1:].split(".")
+    return None
+
+
+def walk_key_path(keys, data):
+    """Walk a dotted key path through nested dicts the way jq would:
+    a missing key or a null intermediate value gives None.
+
+    Args:
+        keys (list): The list of keys to follow
+        data (dict): The data to walk through
+
+    Raises:
+        TypeError: Raise an exception if a value that is neither a dict
+            nor None has to be indexed. jq errors out on such data, so
+            callers fall back to the jq engine to keep its behavior.
+    """
+    for key in keys:
+        if data is None:
+            return None
+        if not isinstance(data, dict):
+            raise TypeError(
+                "Cannot index {} with '{}'".format(type(data).__name__, key)
+            )
+        data = data.get(key)
+    return data
+
+
+def yaml_safe_load(stream):
+    """Parse a YAML document with the C accelerated safe loader when
+    available, falling back on the pure Python one otherwise.
+
+    Args:
+        stream: The document to parse, as a string, bytes or open file
+    """
+    return yaml.load(stream, Loader=YamlSafeLoader)
+
+
 class YaaniError(Exception):
     pass
 
 
-class Validator:
-    class DataSources:
+class SourceLoader:
+    class Utils:
         @staticmethod
-        def validate_source_args(src_type, src_args):
-            validation_scheme = {
-                SourceLoader.SOURCE_TYPE.NETBOX_API: {
-                    "$schema": "http://json-schema.org/draft-07/schema#",
-                    "$id": "http://example.com/product.schema.json",
-                    "type": "object",
-                    "additionalProperties": False,
-                    "required": ["url"],
-                    "properties": {
-                        "url": {
-                            "type": "string",
-                            "minLength": 1
-                        },
-                        "token": {
-                            "type": "string",
-                            "minLength": 1
-                        },
-                        "private_key": {
-                            "type": "string",
-                            "minLength": 1
-                        },
-                        "private_key_file": {
-                            "type": "string",
-                            "minLength": 1
-                        },
-                        "ssl_verify": {
-                            "type": "boolean",
-                        }
-                    },
-                    "allOf": [
-                        {
-                            "not": {
-                                "required": [
-                                    "private_key",
-                                    "private_key_file"
-                                ]
-                            }
-                        }
-                    ]
-                },
-                SourceLoader.SOURCE_TYPE.FILE: {
-                    "$schema": "http://json-schema.org/draft-07/schema#",
-                    "$id": "http://example.com/product.schema.json",
-                    "type": "object",
-                    "additionalProperties": False,
-                    "required": ["path", "content_type"],
-                    "properties": {
-                        "path": {
-                            "type": "string",
-                            "minLength": 1
-                        },
-                        "content_type": {
-                            "type": "string",
-                            "enum": ["yaml", "json"],
-                        }
-                    }
-                },
-                SourceLoader.SOURCE_TYPE.SCRIPT: {
-                    "$schema": "http://json-schema.org/draft-07/schema#",
-                    "$id": "http://example.com/product.schema.json",
-                    "type": "object",
-                    "additionalProperties": False,
-                    "required": ["path", "content_type"],
-                    "properties": {
-                        "path": {
-                            "type": "string",
-                            "minLength": 1
-                        },
-                        "content_type": {
-                            "type": "string",
-                            "enum": ["yaml", "json"],
-                        }
-                    }
-                }
+        def instantiate_source(src_type, args):
+            """Instantiate and return an object corresponding to the given
+            source type and args.
+            """
+            sources = {
+                SourceLoader.SOURCE_TYPE.NETBOX_API: NetboxSource,
+                SourceLoader.SOURCE_TYPE.FILE: FileSource,
+                SourceLoader.SOURCE_TYPE.SCRIPT: ScriptSource,
             }
-
             try:
-                schema = validation_scheme[src_type]
-            except KeyError:
+                # Determine the class to instantiate
+                source_class = sources[src_type]
+            except KeyError as err:
                 raise YaaniError(
-                    "The specified source type '{}' is not valid."
-                    .format(src_type)
+                    "The source type '{}' is not valid.".format(src_type)
                 )
 
             try:
-                v = validate(
-                    instance=src_args,
-                    schema=schema
-                )
-            except ValidationError as err:
+                # Actually instantiate the data source
+                data_source = source_class(args)
+            except TypeError as err:
+                # The json schema should control args given at runtime
+                # instantiation. If bad args were not to be filtered,
+                # this is where the error will be handled
                 raise YaaniError(
-                    "The configuration file parsing failed due to an error in "
-                    "the '{}' section: \n{}\n{}.".format(
-                        src_type, err.instance, err.message
-                    )
+                    "The arguments given to '{}' source are not valid."
+                    .format(str(src_type))
                 )
+            return data_source
 
-        @staticmethod
-        def validate_configuration(configuration):
-            data_sources_section = {
-                "$schema": "http://json-schema.org/draft-07/schema#",
-                "$id": "http://example.com/product.schema.json",
-                "type": "object",
-                "minProperties": 1,
-                "patternProperties": {
-                    "[A-Za-z0-9_-]+": {
-                        "type": "object",
-                        "additionalProperties": False,
-                        "required": ["type", "args"],
-                        "properties": {
-                            "type": {
-                                "type": "string",
-                                "enum": [
-                                    SourceLoader.SOURCE_TYPE.NETBOX_API,
-                                    SourceLoader.SOURCE_TYPE.FILE,
-                                    SourceLoader.SOURCE_TYPE.SCRIPT
-                                ]
-                            },
-                            "args": {
-                                "type": "object",
-                                "minProperties": 1
-                            }
-                        }
-                    }
-                }
-            }
+    class SOURCE_TYPE:
+        NETBOX_API = "netbox_api"
+        FILE = "file"
+        SCRIPT = "script"
+        ORDER = {
+            FILE: 3,
+            SCRIPT: 2,
+            NETBOX_API: 1,
+        }
 
-            try:
-                v = validate(
-                    instance=configuration,
-                    schema=data_sources_section
+    def __init__(self, configuration={}):
+        self._configuration = configuration
+
+    @property
+    def configuration(self):
+        return self._configuration
+
+    @configuration.setter
+    def configuration(self, value):
+        self._configuration = value
+
+    def load_sources(self):
+        """
+        Returns:
+            dict: A dictionnary referencing sources object.
+
+        Raises:
+            YaaniError: Raise an exception if a source is found to be
+                defined twice.
+        """
+        sources = {}
+
+        # For each data source definition, parse it and instantiate it
+        for src_name, src_def in self._configuration.items():
+            if len(src_name) == 0:
+                raise YaaniError(
+                    "A source name cannot be empty."
                 )
-            except ValidationError as err:
+            try:
+                src_type = src_def["type"]
+                src_args = src_def["args"]
+            except KeyError as err:
                 raise YaaniError(
-                    "The configuration file parsing failed due to an error in "
-                    "the 'data_sources' section: \n{}\n{}".format(
-                        err.instance, err.message
-                    )
+                    "The source '{}' is missing the key '{}'.\n"
+                    .format(src_name, err.args[0])
                 )
 
-            for _, src_def in configuration.items():
-                Validator.DataSources.validate_source_args(
-                    src_def['type'],
-                    src_def['args']
+            # Check for previous definition of the source
+            if src_name in sources:
+                raise YaaniError(
+                    "The source '{}' is defined twice."
+                    .format(src_name)
                 )
 
-    class DataSets:
-        @staticmethod
-        def validate_configuration(configuration):
-            schema = {
-                "$schema": "http://json-schema.org/draft-07/schema#",
-                "$id": "http://example.com/product.schema.json",
-                "type": "array",
-                "minItems": 1,
-                "items": {
-                    "type": "object",
-                    "additionalProperties": False,
-                    "required": ["from", "args", "name"],
-                    "properties": {
-                        "name": {
-                            "type": "string",
-                            "minLength": 1
-                        },
-                        "from": {
-                            "type": "string",
-                            "enum": [
-                                DataSetLoader.STRATEGY.SOURCE,
-                                DataSetLoader.STRATEGY.MERGE,
-                                DataSetLoader.STRATEGY.DECORATION,
-                                DataSetLoader.STRATEGY.FILTERING,
-                            ]
-                        },
-                        "args": {
-                            "oneOf": [
-                                {
-                                    "type": "object",
-                                },
-                                {
-                                    "type": "array",
-                                },
-                            ]
-                        }
-                    }
-                }
-            }
-
+            # Instantiate source
             try:
-                v = validate(
-                    instance=configuration,
-                    schema=schema
+                sources[src_name] = SourceLoader.Utils.instantiate_source(
+                    src_type,
+                    src_args
                 )
-            except ValidationError as err:
+            except YaaniError as err:
                 raise YaaniError(
-                    "The configuration file parsing failed due to an error in "
-                    "the 'data_sets' section: \n{}\n{}".format(
-                        err.instance, err.message
-                    )
+                    "An error occured while instantiating source '{}'.\n{}"
+                    .format(src_name, str(err))
                 )
 
+        return sources
+
+
+class DataSetLoader:
+    class Utils:
         @staticmethod
-        def validate_data_set_args(strategy, args):
-            value = {
-                "type": "string",
-                "minLength": 1
+        def map_elt_to_value(query, elt_lst, overlap=False):
+            # Map elt to their id
+            tmp_dct = {
+                id(elt): elt for elt in elt_lst
             }
+            # Plain dotted-path queries, the common case for pivots, are
+            # resolved with a simple dict walk instead of the jq engine
+            keys = simple_key_path(query)
+            mpng = None
+            if keys is not None:
+                try:
+                    mpng = [
+                        (uid, walk_key_path(keys, elt))
+                        for uid, elt in tmp_dct.items()
+                    ]
+                except TypeError:
+                    # Exotic data: let jq raise its own error
+                    mpng = None
+            if mpng is None:
+                # Execute query on elt
+                try:
+                    mpng = compile_query(
+                        MAP_QUERY_TEMPLATE.format(query)
+                    ).first(list(tmp_dct.items()))
+                except ValueError as err:
+                    raise YaaniError(
+                        "The given query '{}' seems to be incorrect.\n"
+                        .format(query)
+                    )
 
-            validation_scheme = {
-                DataSetLoader.STRATEGY.NETBOX_SOURCE: {
-                    "$schema": "http://json-schema.org/draft-07/schema#",
-                    "$id": "http://example.com/product.schema.json",
-                    "type": "object",
-                    "required": ["name", "app", "type"],
-                    "additionalProperties": False,
-                    "properties": {
-                        "name": {
-                            "type": "string",
-                            "minLength": 1
-                        },
-                        "app": {
-                            "type": "string",
-                            "minLength": 1
-                        },
-                        "type": {
-                            "type": "string",
-                            "minLength": 1
-                        },
-                        "filters": {
-                            "type": "array",
-                            "minItems": 1,
-                            "items": {
-                                "type": "object",
-                                "minProperties": 1
-                            }
-                        }
-                    }
-                },
-                DataSetLoader.STRATEGY.FILE_SOURCE: {
-                    "$schema": "http://json-schema.org/draft-07/schema#",
-                    "$id": "http://example.com/product.schema.json",
-                    "type": "object",
-                    "required": ["name", "filter"],
-                    "additionalProperties": False,
-                    "properties": {
-                        "name": {
-                            "type": "string",
-                            "minLength": 1
-                        },
-                        "filter": {
-                            "type": "string",
-                            "minLength": 1
-                        }
-                    }
-                },
-                DataSetLoader.STRATEGY.FILTERING: {
-                    "$schema": "http://json-schema.org/draft-07/schema#",
-                    "$id": "http://example.com/product.schema.json",
-                    "type": "object",
-                    "required": ["name", "filter"],
-                    "additionalProperties": False,
-                    "properties": {
-                        "name": {
-                            "type": "string",
-                            "minLength": 1
-                        },
-                        "filter": {
-                            "type": "string",
-                            "minLength": 1
-                        }
-                    }
-                },
-                DataSetLoader.STRATEGY.MERGE: {
-                    "definitions": {
-                        "value": value
-                    },
-                    "$schema": "http://json-schema.org/draft-07/schema#",
-                    "$id": "http://example.com/product.schema.json",
-                    "required": ["sets"],
-                    "type": "object",
-                    "additionalProperties": False,
-                    "properties": {
-                        "sets": {
-                            "type": "array",
-                            "minItems": 2,
-                            "items": {
-                                "type": "object",
-                                "additionalProperties": False,
-                                "required": ["name", "pivot"],
-                                "properties": {
-                                    "name": {
-                                        "type": "string",
-                                        "minLength": 1
-                                    },
-                                    "pivot": {
-                                        "$ref": "#/definitions/value"
-                                    }
-                                }
-                            }
-                        },
-                        "keys": {
-                            "type": "object",
-                            "minProperties": 1,
-                            "patternProperties": {
-                                "[A-Za-z0-9_-]+": {
-                                    "type": "string",
-                                    "minLength": 1
-                                }
-                            }
-                        }
-                    }
-                },
-                DataSetLoader.STRATEGY.DECORATION: {
-                    "definitions": {
-                        "value": value
-                    },
-                    "$schema": "http://json-schema.org/draft-07/schema#",
-                    "$id": "http://example.com/product.schema.json",
-                    "type": "object",
-                    "required": ["main", "decorators"],
-                    "additionalProperties": False,
-                    "properties": {
-                        "main": {
-                            "type": "object",
-                            "additionalProperties": False,
-                            "required": ["name", "pivot"],
-                            "properties": {
-                                "name": {
-                                    "$ref": "#/definitions/value"
-                                },
-                                "pivot": {
-                                    "$ref": "#/definitions/value"
-                                },
-                                "exclusive": {
-                                    "type": "boolean"
-                                }
-                            }
-                        },
-                        "decorators": {
-                            "type": "array",
-                            "minItems": 1,
-                            "items": {
-                                "type": "object",
-                                "additionalProperties": False,
-                                "required": ["name", "pivot", "anchor"],
-                                "properties": {
-                                    "name": {
-                                        "$ref": "#/definitions/value"
-                                    },
-                                    "anchor": {
-                                        "$ref": "#/definitions/value"
-                                    },
-                                    "pivot": {
-                                        "$ref": "#/definitions/value"
-                                    }
-                                }
-                            }
-                        }
-                    }
-                },
-            }
+            result_dict = {}
+            if overlap:
+                for uid, indx in mpng:
+                    if indx:
+                        if isinstance(indx, list) or isinstance(indx, dict):
+                            raise YaaniError(
+                                "From query '{}'.\n"
+                                "A list or a dict cannot be used as a pivot:\n"
+                                "{}".format(query, indx)
+                            )
+                        result_dict.setdefault(indx, []).append(tmp_dct[uid])
+            else:
+                for uid, indx in mpng:
+                    if indx:
+                        if isinstance(indx, list) or isinstance(indx, dict):
+                            raise YaaniError(
+                                "From query '{}'.\n"
+                                "A list or a dict cannot be used as a pivot:\n"
+                                "{}".format(query, indx)
+                            )
+                        if indx in result_dict:
+                            raise YaaniError(
+                                "The query '{}' leads to non-unique values:\n"
+                                "{}\n".format(query, indx)
+                            )
+                        else:
+                            result_dict[indx] = tmp_dct[uid]
+
+            return result_dict
 
+        @staticmethod
+        def create_dataset_from_source(config, sources):
+            src_name = config["name"]
             try:
-                schema = validation_scheme[strategy]
+                # Use config as args for instanciation removing
+                # the key 'name'
+                lst = sources[src_name].extract({
+                    k: v for k, v in config.items() if k != "name"
+                })
             except KeyError:
-                # Already covered
                 raise YaaniError(
-                    "The specified strategy '{}' is not valid. Please choose "
-                    "between:  - source\n  - merge\n  - decoration\n"
-                    .format(strategy)
+                    "The source '{}' refers to an unexisting source."
+                    .format(src_name)
                 )
 
-            try:
-                v = validate(
-                    instance=args,
-                    schema=schema
-                )
-            except ValidationError as err:
-                raise YaaniError(
-                    "The configuration file parsing failed due to an error in "
-                    "the 'data_sets' section: \n{}\n{}."
-                    .format(
-                        err.instance, err.message
-                    )
-                )
+            return lst
 
-    class Render:
         @staticmethod
-        def validate_configuration(configuration):
-            value = {
-                "type": "object",
-                "minProperties": 1,
-                "required": ["value"],
-                "additionalProperties": False,
-                "properties": {
-                    "value": {
-                        "type": "string",
-                        "minLength": 1
-                    },
-                    "namespace": {
-                        "type": "string",
-                        "enum": [
-                            "import",
-                            "build"
-                        ]
-                    }
-                }
-            }
-
-            render_section = {
-                "definitions": {
-                    "value": value
-                },
-                "$schema": "http://json-schema.org/draft-07/schema#",
-                "$id": "http://example.com/product.schema.json",
-                "type": "object",
-                "additionalProperties": False,
-                "required": ["elements"],
-                "properties": {
-                    "elements": {
-                        "type": "array",
-                        "minItems": 1,
-                        "items": {
-                            "type": "object",
-                            "additionalProperties": False,
-                            "required": ["name", "args"],
-                            "properties": {
-                                "name": {
-                                    "type": "string",
-                                    "minLength": 1
-                                },
-                                "args": {
-                                    "type": "object",
-                                    "minProperties": 1,
-                                    "additionalProperties": False,
-                                    "required": ["index"],
-                                    "properties": {
-                                        "pre_condition": {
-                                            "type": "string",
-                                            "minLength": 1
-                                        },
-                                        "post_condition": {
-                                            "$ref": "#/definitions/value"
-                                        },
-                                        "group_by": {
-                                            "type": "array",
-                                            "minItems": 1,
-                                            "items": {
-                                                "$ref": "#/definitions/value"
-                                            }
-                                        },
-                                        "group_prefix": {
-                                            "type": "string",
-                                        },
-                                        "index": {
-                                            "$ref": "#/definitions/value"
-                                        },
-                                        "host_vars": {
-                                            "type": "object",
-                                            "minProperties": 1,
-                                            "patternProperties": {
-                                                "[A-Za-z0-9_-]+": {
-                                                    "type": "string",
-                                                    "minLength": 1
-                                                }
-                                            }
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                    },
-                    "group_vars": {
-                        "type": "array",
-                        "minItems": 1,
-                        "items": {
-                            "type": "object",
-                            "required": ["group", "set"],
-                            "additionalProperties": False,
-                            "properties": {
-                                "group": {
-                                    "type": "string",
-                                    "minLength": 1
-                                },
-                                "set": {
-                                    "type": "string",
-                                    "minLength": 1
-                                }
-                            }
-                        }
-                    },
-                    "group_hierarchy": {
-                        "type": "object",
-                        "minProperties": 1
-                    }
-                }
-            }
+        def create_dataset_from_merge(config, data_sets):
+            sets = config["sets"]
+            keys = config.get("keys", {})
 
             try:
-                v = validate(
-                    instance=configuration,
-                    schema=render_section
-                )
-            except ValidationError as err:
+                arg_lst = [
+                    (arg["name"], arg["pivot"], data_sets[arg["name"]])
+                    for arg in sets
+                ]
+            except KeyError as err:
                 raise YaaniError(
-                    "The configuration file parsing failed due to an error in "
-                    "the 'render' section: \n{}\n{}".format(
-                        err.instance, err.message
-                    )
+                    "'{}' refers to an unexisting data_set."
+                    .format(err.args[0])
                 )
+            return DataSetLoader.Utils.merge_sets(
+                arg_lst,
+                keys
+            )
 
-    class Transform:
         @staticmethod
-        def validate_configuration(configuration):
-            transform = {
-                "$schema": "http://json-schema.org/draft-07/schema#",
-                "$id": "http://example.com/product.schema.json",
-                "type": "array",
-                "items": {
-                    "type": "object",
-                    "additionalProperties": False,
-                    "required": ["module", "func"],
-                    "properties": {
-                        "module": {
-                            "type": "string",
-                            "minLength": 1
-                        },
-                        "func": {
-                            "type": "string",
-                            "minLength": 1
-                        }
-                    }
-                }
-            }
+        def merge_sets(set_lst, keys):
+            # Create an index for each set
+            indxd_lst = []
 
-            try:
-                v = validate(
-                    instance=configuration,
-                    schema=transform
-                )
-            except ValidationError as err:
-                raise YaaniError(
-                    "The configuration file parsing failed due to an error in "
-                    "the 'transform' section: \n{}\n{}".format(
-                        err.instance, err.message
+            for name, pvt_args, data_set in set_lst:
+                # Associate elts to their pivot query result
+                try:
+                    indxd_dct = DataSetLoader.Utils.map_elt_to_value(
+                        pvt_args,
+                        data_set
                     )
-                )
-
+                except YaaniError as err:
+                    raise YaaniError(
+                        "The merge of set '{}' failed:\n{}"
+                        .format(name, str(err))
+                    )
+                indxd_lst.append((name, indxd_dct))
 
-class SourceLoader:
-    class Utils:
-        @staticmethod
-        def instantiate_source(src_type, args):
-            """Instantiate and return an object corresponding to the given
-            source type and args.
-            """
-            sources = {
-                SourceLoader.SOURCE_TYPE.NETBOX_API: NetboxSource,
-                SourceLoader.SOURCE_TYPE.FILE: FileSource,
-                SourceLoader.SOURCE_TYPE.SCRIPT: ScriptSource,
-            }
-            try:
-                # Determine the class to instantiate
-                source_class = sources[src_type]
-            except KeyError as err:
-                raise YaaniError(
-                    "The source type '{}' is not valid.".format(src_type)
-                )
+            # Get the exhaustive index list without duplicates
+            idxs = set()
+            for name, indxd_dct in indxd_lst:
+                idxs.update(indxd_dct)
 
-            try:
-                # Actually instantiate the data source
-                data_source = source_class(args)
-            except TypeError as err:
-                # The json schema should control args given at runtime
-                # instantiation. If bad args were not to be filtered,
-                # this is where the error will be handled
-                raise YaaniError(
-                    "The arguments given to '{}' source are not valid."
-                    .format(str(src_type))
-                )
-            return data_source
+            # Map each indexed set to its name once, instead of
+            # rebuilding the mapping for every single index below
+            sets_by_name = dict(indxd_lst)
 
-    class SOURCE_TYPE:
-        NETBOX_API = "netbox_api"
-        FILE = "file"
-        SCRIPT = "script"
-        ORDER = {
-            FILE: 3,
-            SCRIPT: 2,
-            NETBOX_API: 1,
-        }
+            lst = []
+            for cmptd in idxs:
+                r = DataSetLoader.Utils.merge_elts([
+                    setcntnt.get(cmptd, {})
+                    for name, setcntnt in indxd_lst
+                ])
+                if r:
+                    # Handle priority keys
+                    for k, ds in keys.items():
+                        prio_elt = sets_by_name.get(ds, {}).get(cmptd, {})
+                        if k in prio_elt:
+                            r[k] = prio_elt[k]
 
-    def __init__(self, configuration={}):
-        self._configuration = configuration
+                    lst.append(r)
 
-    @property
-    def configuration(self):
-        return self._configuration
+            return lst
 
-    @configuration.setter
-    def configuration(self, value):
-        self._configuration = value
+        @staticmethod
+        def merge_elts(elts):
+            # Invert list to priorize data from first elements
+            elts.reverse()
 
-    def load_sources(self):
-        """
-        Returns:
-            dict: A dictionnary referencing sources object.
+            new_elt = {}
+            for elt in elts:
+                new_elt.update(elt)
 
-        Raises:
-            YaaniError: Raise an exception if a source is found to be
-                defined twice.
-        """
-        sources = {}
+            return new_elt
 
-        # For each data source definition, parse it and instantiate it
-        for src_name, src_def in self._configuration.items():
-            if len(src_name) == 0:
+        @staticmethod
+        def decorate_dataset(config, data_sets):
+            exclusive = config["main"].get("exclusive", True)
+            try:
+                idx_main_set = DataSetLoader.Utils.map_elt_to_value(
+                    config["main"]["pivot"],  # Pivot
+                    data_sets[config["main"]["name"]],  # Data set
+                    overlap=not exclusive
+                )
+            except KeyError as err:
                 raise YaaniError(
-                    "A source name cannot be empty."
+                    "The set '{}' has not been declared.\n"
+                    .format(err.args[0])
+                )
+            except YaaniError as err:
+                raise YaaniError(
+                    "The main set '{}' could not be decorated:\n{}"
+                    .format(config["main"]["name"], str(err))
                 )
             try:
-                src_type = src_def["type"]
-                src_args = src_def["args"]
+                idx_add_set_lst = [
+                    (
+                        cfg["anchor"],
+                        DataSetLoader.Utils.map_elt_to_value(
+                            cfg["pivot"],
+                            data_sets[cfg["name"]],
+                            overlap=True
+                        )
+                    )
+                    for cfg in config["decorators"]
+                ]
             except KeyError as err:
                 raise YaaniError(
-                    "The source '{}' is missing the key '{}'.\n"
-                    .format(src_name, err.args[0])
+                    "The set '{}' has not been declared.\n"
+                    .format(err.args[0])
                 )
-
-            # Check for previous definition of the source
-            if src_name in sources:
+            except YaaniError as err:
                 raise YaaniError(
-                    "The source '{}' is defined twice."
-                    .format(src_name)
+                    "One of the decorating sets could not be used.\n{}"
+                    .format(str(err))
                 )
 
-            # Instantiate source
+            r_lst = []
+            if exclusive:
+                for idx, elt in idx_main_set.items():
+                    sublst = [
+                        (anchor, ds.get(idx))
+                        for anchor, ds in idx_add_set_lst
+                        if idx is not None and ds.get(idx)
+                    ]
+                    r_lst.append(
+                        DataSetLoader.Utils.decorate_element(
+                            elt,
+                            sublst
+                        )
+                    )
+            else:
+                for idx, elt_list in idx_main_set.items():
+                    sublst = [
+                        (anchor, ds.get(idx))
+                        for anchor, ds in idx_add_set_lst
+                        if idx is not None and ds.get(idx)
+                    ]
+                    for elt in elt_list:
+                        r_lst.append(
+                            DataSetLoader.Utils.decorate_element(
+                                elt,
+                                sublst
+                            )
+                        )
+            return r_lst
+
+        @staticmethod
+        def create_dataset_from_filtering(args, data_sets):
+            query = args["filter"]
+            ds_name = args["name"]
             try:
-                sources[src_name] = SourceLoader.Utils.instantiate_source(
-                    src_type,
-                    src_args
-                )
-            except YaaniError as err:
+                ds = data_sets[ds_name]
+            except KeyError:
                 raise YaaniError(
-                    "An error occured while instantiating source '{}'.\n{}"
-                    .format(src_name, str(err))
+                    "Unknown set '{}'\n"
+                    .format(ds_name)
                 )
 
-        return sources
-
-
-class DataSetLoader:
-    class Utils:
-        @staticmethod
-        def map_elt_to_value(query, elt_lst, overlap=False):
-            # Map elt to their id
-            tmp_dct = {
-                id(elt): elt for elt in elt_lst
-            }
-            # Execute query on elt
             try:
-                mpng = pyjq.first(
-                    "[ .[] | [.[0], (.[1]{})]]".format(query),
-                    list(tmp_dct.items())
-                )
+                r = compile_query(query).first(ds)
             except ValueError as err:
                 raise YaaniError(
-                    "The given query '{}' seems to be incorrect.\n"
+                    "The given query seems to be incorrect: {}\n"
                     .format(query)
                 )
-            # Convert the output lists to tuples
-            mpng = [tuple(x) for x in mpng]
 
-            result_dict = {}
-            if overlap:
-                for uid, indx in mpng:
-                    if indx:
-                        if isinstance(indx, list) or isinstance(indx, dict):
-                            raise YaaniError(
-                                "From query '{}'.\n"
-                                "A list or a dict cannot be used as a pivot:\n"
-                                "{}".format(query, indx)
-                            )
-                        result_dict.setdefault(indx, []).append(tmp_dct[uid])
-            else:
-                for uid, indx in mpng:
-                    if indx:
-                        if isinstance(indx, list) or isinstance(indx, dict):
-                            raise YaaniError(
-                                "From query '{}'.\n"
-                                "A list or a dict cannot be used as a pivot:\n"
-                                "{}".format(query, indx)
-                            )
-                        if indx in result_dict:
-                            raise YaaniError(
-                                "The query '{}' leads to non-unique values:\n"
-                                "{}\n".format(query, indx)
-                            )
-                        else:
-                            result_dict[indx] = tmp_dct[uid]
+            return r
 
-            return result_dict
+        @staticmethod
+        def decorate_element(elt, data):
+            new_elt = {}
+            new_elt.update(elt)
+            for anchor, value in data:
+                new_elt[anchor] = value
+
+            return new_elt
 
         @staticmethod
-        def create_dataset_from_source(config, sources):
-            src_name = config["name"]
-            try:
-                # Use config as args for instanciation removing
-                # the key 'name'
-                lst = sources[src_name].extract({
-                    k: v for k, v in config.items() if k != "name"
-                })
-            except KeyError:
+        def create_set(strategy, args, sources, data_sets):
+            # Select the proper method to execute
+            if strategy == DataSetLoader.STRATEGY.SOURCE:
+                data_set = DataSetLoader.Utils.create_dataset_from_source(
+                    args,
+                    sources
+                )
+            elif strategy == DataSetLoader.STRATEGY.FILTERING:
+                data_set = DataSetLoader.Utils.create_dataset_from_filtering(
+                    args,
+                    data_sets
+                )
+            elif strategy == DataSetLoader.STRATEGY.MERGE:
+                data_set = DataSetLoader.Utils.create_dataset_from_merge(
+                    args,
+                    data_sets
+                )
+            elif strategy == DataSetLoader.STRATEGY.DECORATION:
+                data_set = DataSetLoader.Utils.decorate_dataset(
+                    args,
+                    data_sets
+                )
+            else:
                 raise YaaniError(
-                    "The source '{}' refers to an unexisting source."
-                    .format(src_name)
+                    "'{}' is not a valid strategy."
+                    .format(strategy)
                 )
 
-            return lst
+            return data_set
 
-        @staticmethod
-        def create_dataset_from_merge(config, data_sets):
-            sets = config["sets"]
-            keys = config.get("keys", {})
+    class STRATEGY:
+        SOURCE = "source"
+        NETBOX_SOURCE = "netbox_source"
+        FILE_SOURCE = "file_source"
+        MERGE = "merge"
+        DECORATION = "decoration"
+        FILTERING = "filtering"
 
-            try:
-                arg_lst = [
-                    (arg["name"], arg["pivot"], data_sets[arg["name"]])
-                    for arg in sets
-                ]
-            except KeyError as err:
+    def __init__(self, configuration=[]):
+        self._configuration = configuration
+
+    @property
+    def configuration(self):
+        return self._configuration
+
+    @configuration.setter
+    def configuration(self, configuration):
+        self._configuration = configuration
+
+    def load_data_sets(self, sources):
+        data_sets = {}
+
+        # Check for multiple definitions of sets
+        seen = set()
+        for ds_def in self._configuration:
+            if ds_def['name'] not in seen:
+                seen.add(ds_def['name'])
+            else:
                 raise YaaniError(
-                    "'{}' refers to an unexisting data_set."
-                    .format(err.args[0])
+                    "The data set '{}' is defined twice.\n"
+                    .format(ds_def['name'])
                 )
-            return DataSetLoader.Utils.merge_sets(
-                arg_lst,
-                keys
-            )
 
-        @staticmethod
-        def merge_sets(set_lst, keys):
-            # Create an index for each set
-            indxd_lst = []
+        # Resolve strategies and validate every definition up front so
+        # that source backed sets can be fetched concurrently below
+        prepared = []
+        for ds_def in self._configuration:
+            # Extract variables
+            ds_strat = ds_def['from']
+            ds_args = ds_def['args']
+            ds_name = ds_def['name']
 
-            for name, pvt_args, data_set in set_lst:
-                # Associate elts to their pivot query result
+            strategy = ds_strat
+
+            if strategy == DataSetLoader.STRATEGY.SOURCE:
+                m = {
+                    NetboxSource: DataSetLoader.STRATEGY.NETBOX_SOURCE,
+                    FileSource: DataSetLoader.STRATEGY.FILE_SOURCE,
+                    ScriptSource: DataSetLoader.STRATEGY.FILE_SOURCE
+                }
                 try:
-                    indxd_dct = DataSetLoader.Utils.map_elt_to_value(
-                        pvt_args,
-                        data_set
+                    src_name = ds_args['name']
+                except KeyError as err:
+                    raise YaaniError(
+                        "Missing key '{}' in data sets '{}' creation "
+                        "arguments.\n"
+                        .format(err.args[0], ds_name)
                     )
-                except YaaniError as err:
+                try:
+                    strategy = m[type(sources.get(src_name))]
+                except KeyError as err:
                     raise YaaniError(
-                        "The merge of set '{}' failed:\n{}"
-                        .format(name, str(err))
+                        "The source name '{}' refers to an undeclared "
+                        "source. Please make sure this source is "
+                        "declared in the 'data_sources' section."
+                        .format(src_name)
                     )
-                indxd_lst.append((name, indxd_dct))
-
-            # Get the exhaustive index list without duplicates
-            idxs = list(set(reduce(
-                lambda x, y: x + y,
-                [list(idx.keys()) for name, idx in indxd_lst]
-            )))
+            # Validate data set arguments
+            Validator.DataSets.validate_data_set_args(
+                strategy,
+                ds_args
+            )
 
-            lst = []
-            for cmptd in idxs:
-                elts = [
-                    (name, setcntnt.get(cmptd, {}))
-                    for name, setcntnt in indxd_lst
-                ]
-                r = DataSetLoader.Utils.merge_elts([lst for name, lst in elts])
-                if r:
-                    # Handle priority keys
-                    dsdct = dict(elts)
-                    for k, ds in keys.items():
-                        if k in dsdct.get(ds, {}):
-                            r[k] = dsdct[ds][k]
+            prepared.append((ds_name, ds_strat, ds_args))
+
+        # Source backed sets only depend on their data source and are
+        # network or disk bound, so they are extracted concurrently.
+        # The other strategies may refer to previously declared sets and
+        # keep being created sequentially, in declaration order
+        fetchable = [
+            (ds_name, ds_args)
+            for ds_name, ds_strat, ds_args in prepared
+            if ds_strat == DataSetLoader.STRATEGY.SOURCE
+        ]
+        futures = {}
+        executor = None
+        if len(fetchable) > 1:
+            executor = ThreadPoolExecutor(
+                max_workers=min(len(fetchable), 8)
+            )
+            futures = {
+                ds_name: executor.submit(
+                    DataSetLoader.Utils.create_dataset_from_source,
+                    ds_args,
+                    sources
+                )
+                for ds_name, ds_args in fetchable
+            }
 
-                    lst.append(r)
+        try:
+            for ds_name, ds_strat, ds_args in prepared:
+                # Actually create the data set and place it in the
+                # proper place
+                try:
+                    if ds_name in futures:
+                        data_sets[ds_name] = futures[ds_name].result()
+                    else:
+                        data_sets[ds_name] = DataSetLoader.Utils.create_set(
+                            strategy=ds_strat,
+                            args=ds_args,
+                            sources=sources,
+                            data_sets=data_sets
+                        )
+                except YaaniError as err:
+                    raise YaaniError(
+                        "Could not create data set '{}':\n{}"
+                        .format(ds_name, str(err))
+                    )
+        finally:
+            if executor is not None:
+                executor.shutdown()
 
-            return lst
+        return data_sets
 
-        @staticmethod
-        def merge_elts(elts):
-            # Invert list to priorize data from first elements
-            elts.reverse()
 
-            new_elt = {}
-            for elt in elts:
-                new_elt.update(elt)
+class Validator:
+    class DataSources:
+        VALIDATION_SCHEME = {
+            SourceLoader.SOURCE_TYPE.NETBOX_API: {
+                "$schema": "http://json-schema.org/draft-07/schema#",
+                "$id": "http://example.com/product.schema.json",
+                "type": "object",
+                "additionalProperties": False,
+                "required": ["url"],
+                "properties": {
+                    "url": {
+                        "type": "string",
+                        "minLength": 1
+                    },
+                    "token": {
+                        "type": "string",
+                        "minLength": 1
+                    },
+                    "private_key": {
+                        "type": "string",
+                        "minLength": 1
+                    },
+                    "private_key_file": {
+                        "type": "string",
+                        "minLength": 1
+                    },
+                    "ssl_verify": {
+                        "type": "boolean",
+                    }
+                },
+                "allOf": [
+                    {
+                        "not": {
+                            "required": [
+                                "private_key",
+                                "private_key_file"
+                            ]
+                        }
+                    }
+                ]
+            },
+            SourceLoader.SOURCE_TYPE.FILE: {
+                "$schema": "http://json-schema.org/draft-07/schema#",
+                "$id": "http://example.com/product.schema.json",
+                "type": "object",
+                "additionalProperties": False,
+                "required": ["path", "content_type"],
+                "properties": {
+                    "path": {
+                        "type": "string",
+                        "minLength": 1
+                    },
+                    "content_type": {
+                        "type": "string",
+                        "enum": ["yaml", "json"],
+                    }
+                }
+            },
+            SourceLoader.SOURCE_TYPE.SCRIPT: {
+                "$schema": "http://json-schema.org/draft-07/schema#",
+                "$id": "http://example.com/product.schema.json",
+                "type": "object",
+                "additionalProperties": False,
+                "required": ["path", "content_type"],
+                "properties": {
+                    "path": {
+                        "type": "string",
+                        "minLength": 1
+                    },
+                    "content_type": {
+                        "type": "string",
+                        "enum": ["yaml", "json"],
+                    }
+                }
+            }
+        }
 
-            return new_elt
+        VALIDATORS = {
+            src_type: Draft7Validator(schema)
+            for src_type, schema in VALIDATION_SCHEME.items()
+        }
 
         @staticmethod
-        def decorate_dataset(config, data_sets):
-            exclusive = config["main"].get("exclusive", True)
+        def validate_source_args(src_type, src_args):
             try:
-                idx_main_set = DataSetLoader.Utils.map_elt_to_value(
-                    config["main"]["pivot"],  # Pivot
-                    data_sets[config["main"]["name"]],  # Data set
-                    overlap=not exclusive
-                )
-            except KeyError as err:
-                raise YaaniError(
-                    "The set '{}' has not been declared.\n"
-                    .format(err.args[0])
-                )
-            except YaaniError as err:
+                validator = Validator.DataSources.VALIDATORS[src_type]
+            except KeyError:
                 raise YaaniError(
-                    "The main set '{}' could not be decorated:\n{}"
-                    .format(config["main"]["name"], str(err))
+                    "The specified source type '{}' is not valid."
+                    .format(src_type)
                 )
+
             try:
-                idx_add_set_lst = [
-                    (
-                        cfg["anchor"],
-                        DataSetLoader.Utils.map_elt_to_value(
-                            cfg["pivot"],
-                            data_sets[cfg["name"]],
-                            overlap=True
-                        )
-                    )
-                    for cfg in config["decorators"]
-                ]
-            except KeyError as err:
-                raise YaaniError(
-                    "The set '{}' has not been declared.\n"
-                    .format(err.args[0])
-                )
-            except YaaniError as err:
+                validator.validate(src_args)
+            except ValidationError as err:
                 raise YaaniError(
-                    "One of the decorating sets could not be used.\n{}"
-                    .format(str(err))
+                    "The configuration file parsing failed due to an error in "
+                    "the '{}' section: \n{}\n{}.".format(
+                        src_type, err.instance, err.message
+                    )
                 )
 
-            r_lst = []
-            if exclusive:
-                for idx, elt in idx_main_set.items():
-                    sublst = [
-                        (anchor, ds.get(idx))
-                        for anchor, ds in idx_add_set_lst
-                        if idx is not None and ds.get(idx)
-                    ]
-                    r_lst.append(
-                        DataSetLoader.Utils.decorate_element(
-                            elt,
-                            sublst
-                        )
-                    )
-            else:
-                for idx, elt_list in idx_main_set.items():
-                    sublst = [
-                        (anchor, ds.get(idx))
-                        for anchor, ds in idx_add_set_lst
-                        if idx is not None and ds.get(idx)
-                    ]
-                    for elt in elt_list:
-                        r_lst.append(
-                            DataSetLoader.Utils.decorate_element(
-                                elt,
-                                sublst
-                            )
-                        )
-            return r_lst
+        DATA_SOURCES_SECTION = {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "$id": "http://example.com/product.schema.json",
+            "type": "object",
+            "minProperties": 1,
+            "patternProperties": {
+                "[A-Za-z0-9_-]+": {
+                    "type": "object",
+                    "additionalProperties": False,
+                    "required": ["type", "args"],
+                    "properties": {
+                        "type": {
+                            "type": "string",
+                            "enum": [
+                                SourceLoader.SOURCE_TYPE.NETBOX_API,
+                                SourceLoader.SOURCE_TYPE.FILE,
+                                SourceLoader.SOURCE_TYPE.SCRIPT
+                            ]
+                        },
+                        "args": {
+                            "type": "object",
+                            "minProperties": 1
+                        }
+                    }
+                }
+            }
+        }
+
+        DATA_SOURCES_VALIDATOR = Draft7Validator(DATA_SOURCES_SECTION)
 
         @staticmethod
-        def create_dataset_from_filtering(args, data_sets):
-            query = args["filter"]
-            ds_name = args["name"]
+        def validate_configuration(configuration):
             try:
-                ds = data_sets[ds_name]
-            except KeyError:
+                Validator.DataSources.DATA_SOURCES_VALIDATOR.validate(
+                    configuration
+                )
+            except ValidationError as err:
                 raise YaaniError(
-                    "Unknown set '{}'\n"
-                    .format(ds_name)
+                    "The configuration file parsing failed due to an error in "
+                    "the 'data_sources' section: \n{}\n{}".format(
+                        err.instance, err.message
+                    )
+                )
+
+            for _, src_def in configuration.items():
+                Validator.DataSources.validate_source_args(
+                    src_def['type'],
+                    src_def['args']
                 )
 
+    class DataSets:
+        CONFIGURATION_SECTION = {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "$id": "http://example.com/product.schema.json",
+            "type": "array",
+            "minItems": 1,
+            "items": {
+                "type": "object",
+                "additionalProperties": False,
+                "required": ["from", "args", "name"],
+                "properties": {
+                    "name": {
+                        "type": "string",
+                        "minLength": 1
+                    },
+                    "from": {
+                        "type": "string",
+                        "enum": [
+                            DataSetLoader.STRATEGY.SOURCE,
+                            DataSetLoader.STRATEGY.MERGE,
+                            DataSetLoader.STRATEGY.DECORATION,
+                            DataSetLoader.STRATEGY.FILTERING,
+                        ]
+                    },
+                    "args": {
+                        "oneOf": [
+                            {
+                                "type": "object",
+                            },
+                            {
+                                "type": "array",
+                            },
+                        ]
+                    }
+                }
+            }
+        }
+
+        CONFIGURATION_VALIDATOR = Draft7Validator(CONFIGURATION_SECTION)
+
+        @staticmethod
+        def validate_configuration(configuration):
             try:
-                r = pyjq.first(
-                    query,
-                    ds
+                Validator.DataSets.CONFIGURATION_VALIDATOR.validate(
+                    configuration
                 )
-            except ValueError as err:
+            except ValidationError as err:
                 raise YaaniError(
-                    "The given query seems to be incorrect: {}\n"
-                    .format(query)
+                    "The configuration file parsing failed due to an error in "
+                    "the 'data_sets' section: \n{}\n{}".format(
+                        err.instance, err.message
+                    )
                 )
 
-            return r
+        VALUE = {
+            "type": "string",
+            "minLength": 1
+        }
 
-        @staticmethod
-        def decorate_element(elt, data):
-            new_elt = {}
-            new_elt.update(elt)
-            for anchor, value in data:
-                new_elt[anchor] = value
+        VALIDATION_SCHEME = {
+            DataSetLoader.STRATEGY.NETBOX_SOURCE: {
+                "$schema": "http://json-schema.org/draft-07/schema#",
+                "$id": "http://example.com/product.schema.json",
+                "type": "object",
+                "required": ["name", "app", "type"],
+                "additionalProperties": False,
+                "properties": {
+                    "name": {
+                        "type": "string",
+                        "minLength": 1
+                    },
+                    "app": {
+                        "type": "string",
+                        "minLength": 1
+                    },
+                    "type": {
+                        "type": "string",
+                        "minLength": 1
+                    },
+                    "filters": {
+                        "type": "array",
+                        "minItems": 1,
+                        "items": {
+                            "type": "object",
+                            "minProperties": 1
+                        }
+                    },
+                    "brief": {
+                        "type": "boolean"
+                    }
+                }
+            },
+            DataSetLoader.STRATEGY.FILE_SOURCE: {
+                "$schema": "http://json-schema.org/draft-07/schema#",
+                "$id": "http://example.com/product.schema.json",
+                "type": "object",
+                "required": ["name", "filter"],
+                "additionalProperties": False,
+                "properties": {
+                    "name": {
+                        "type": "string",
+                        "minLength": 1
+                    },
+                    "filter": {
+                        "type": "string",
+                        "minLength": 1
+                    }
+                }
+            },
+            DataSetLoader.STRATEGY.FILTERING: {
+                "$schema": "http://json-schema.org/draft-07/schema#",
+                "$id": "http://example.com/product.schema.json",
+                "type": "object",
+                "required": ["name", "filter"],
+                "additionalProperties": False,
+                "properties": {
+                    "name": {
+                        "type": "string",
+                        "minLength": 1
+                    },
+                    "filter": {
+                        "type": "string",
+                        "minLength": 1
+                    }
+                }
+            },
+            DataSetLoader.STRATEGY.MERGE: {
+                "definitions": {
+                    "value": VALUE
+                },
+                "$schema": "http://json-schema.org/draft-07/schema#",
+                "$id": "http://example.com/product.schema.json",
+                "required": ["sets"],
+                "type": "object",
+                "additionalProperties": False,
+                "properties": {
+                    "sets": {
+                        "type": "array",
+                        "minItems": 2,
+                        "items": {
+                            "type": "object",
+                            "additionalProperties": False,
+                            "required": ["name", "pivot"],
+                            "properties": {
+                                "name": {
+                                    "type": "string",
+                                    "minLength": 1
+                                },
+                                "pivot": {
+                                    "$ref": "#/definitions/value"
+                                }
+                            }
+                        }
+                    },
+                    "keys": {
+                        "type": "object",
+                        "minProperties": 1,
+                        "patternProperties": {
+                            "[A-Za-z0-9_-]+": {
+                                "type": "string",
+                                "minLength": 1
+                            }
+                        }
+                    }
+                }
+            },
+            DataSetLoader.STRATEGY.DECORATION: {
+                "definitions": {
+                    "value": VALUE
+                },
+                "$schema": "http://json-schema.org/draft-07/schema#",
+                "$id": "http://example.com/product.schema.json",
+                "type": "object",
+                "required": ["main", "decorators"],
+                "additionalProperties": False,
+                "properties": {
+                    "main": {
+                        "type": "object",
+                        "additionalProperties": False,
+                        "required": ["name", "pivot"],
+                        "properties": {
+                            "name": {
+                                "$ref": "#/definitions/value"
+                            },
+                            "pivot": {
+                                "$ref": "#/definitions/value"
+                            },
+                            "exclusive": {
+                                "type": "boolean"
+                            }
+                        }
+                    },
+                    "decorators": {
+                        "type": "array",
+                        "minItems": 1,
+                        "items": {
+                            "type": "object",
+                            "additionalProperties": False,
+                            "required": ["name", "pivot", "anchor"],
+                            "properties": {
+                                "name": {
+                                    "$ref": "#/definitions/value"
+                                },
+                                "anchor": {
+                                    "$ref": "#/definitions/value"
+                                },
+                                "pivot": {
+                                    "$ref": "#/definitions/value"
+                                }
+                            }
+                        }
+                    }
+                }
+            },
+        }
 
-            return new_elt
+        VALIDATORS = {
+            strategy: Draft7Validator(schema)
+            for strategy, schema in VALIDATION_SCHEME.items()
+        }
 
         @staticmethod
-        def create_set(strategy, args, sources, data_sets):
-            # Select the proper method to execute
-            if strategy == DataSetLoader.STRATEGY.SOURCE:
-                data_set = DataSetLoader.Utils.create_dataset_from_source(
-                    args,
-                    sources
-                )
-            elif strategy == DataSetLoader.STRATEGY.FILTERING:
-                data_set = DataSetLoader.Utils.create_dataset_from_filtering(
-                    args,
-                    data_sets
-                )
-            elif strategy == DataSetLoader.STRATEGY.MERGE:
-                data_set = DataSetLoader.Utils.create_dataset_from_merge(
-                    args,
-                    data_sets
-                )
-            elif strategy == DataSetLoader.STRATEGY.DECORATION:
-                data_set = DataSetLoader.Utils.decorate_dataset(
-                    args,
-                    data_sets
-                )
-            else:
+        def validate_data_set_args(strategy, args):
+            try:
+                validator = Validator.DataSets.VALIDATORS[strategy]
+            except KeyError:
+                # Already covered
                 raise YaaniError(
-                    "'{}' is not a valid strategy."
+                    "The specified strategy '{}' is not valid. Please choose "
+                    "between:  - source\n  - merge\n  - decoration\n"
                     .format(strategy)
                 )
 
-            return data_set
-
-    class STRATEGY:
-        SOURCE = "source"
-        NETBOX_SOURCE = "netbox_source"
-        FILE_SOURCE = "file_source"
-        MERGE = "merge"
-        DECORATION = "decoration"
-        FILTERING = "filtering"
-
-    def __init__(self, configuration=[]):
-        self._configuration = configuration
+            try:
+                validator.validate(args)
+            except ValidationError as err:
+                raise YaaniError(
+                    "The configuration file parsing failed due to an error in "
+                    "the 'data_sets' section: \n{}\n{}."
+                    .format(
+                        err.instance, err.message
+                    )
+                )
 
-    @property
-    def configuration(self):
-        return self._configuration
+    class Render:
+        VALUE = {
+            "type": "object",
+            "minProperties": 1,
+            "required": ["value"],
+            "additionalProperties": False,
+            "properties": {
+                "value": {
+                    "type": "string",
+                    "minLength": 1
+                },
+                "namespace": {
+                    "type": "string",
+                    "enum": [
+                        "import",
+                        "build"
+                    ]
+                }
+            }
+        }
 
-    @configuration.setter
-    def configuration(self, configuration):
-        self._configuration = configuration
+        RENDER_SECTION = {
+            "definitions": {
+                "value": VALUE
+            },
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "$id": "http://example.com/product.schema.json",
+            "type": "object",
+            "additionalProperties": False,
+            "required": ["elements"],
+            "properties": {
+                "elements": {
+                    "type": "array",
+                    "minItems": 1,
+                    "items": {
+                        "type": "object",
+                        "additionalProperties": False,
+                        "required": ["name", "args"],
+                        "properties": {
+                            "name": {
+                                "type": "string",
+                                "minLength": 1
+                            },
+                            "args": {
+                                "type": "object",
+                                "minProperties": 1,
+                                "additionalProperties": False,
+                                "required": ["index"],
+                                "properties": {
+                                    "pre_condition": {
+                                        "type": "string",
+                                        "minLength": 1
+                                    },
+                                    "post_condition": {
+                                        "$ref": "#/definitions/value"
+                                    },
+                                    "group_by": {
+                                        "type": "array",
+                                        "minItems": 1,
+                                        "items": {
+                                            "$ref": "#/definitions/value"
+                                        }
+                                    },
+                                    "group_prefix": {
+                                        "type": "string",
+                                    },
+                                    "index": {
+                                        "$ref": "#/definitions/value"
+                                    },
+                                    "host_vars": {
+                                        "type": "object",
+                                        "minProperties": 1,
+                                        "patternProperties": {
+                                            "[A-Za-z0-9_-]+": {
+                                                "type": "string",
+                                                "minLength": 1
+                                            }
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    }
+                },
+                "group_vars": {
+                    "type": "array",
+                    "minItems": 1,
+                    "items": {
+                        "type": "object",
+                        "required": ["group", "set"],
+                        "additionalProperties": False,
+                        "properties": {
+                            "group": {
+                                "type": "string",
+                                "minLength": 1
+                            },
+                            "set": {
+                                "type": "string",
+                                "minLength": 1
+                            }
+                        }
+                    }
+                },
+                "group_hierarchy": {
+                    "type": "object",
+                    "minProperties": 1
+                }
+            }
+        }
 
-    def load_data_sets(self, sources):
-        data_sets = {}
+        RENDER_VALIDATOR = Draft7Validator(RENDER_SECTION)
 
-        # Check for multiple definitions of sets
-        seen = []
-        for ds_def in self._configuration:
-            if ds_def['name'] not in seen:
-                seen.append(ds_def['name'])
-            else:
+        @staticmethod
+        def validate_configuration(configuration):
+            try:
+                Validator.Render.RENDER_VALIDATOR.validate(configuration)
+            except ValidationError as err:
                 raise YaaniError(
-                    "The data set '{}' is defined twice.\n"
-                    .format(ds_def['name'])
+                    "The configuration file parsing failed due to an error in "
+                    "the 'render' section: \n{}\n{}".format(
+                        err.instance, err.message
+                    )
                 )
 
-        # Instantiate every data sets
-        for ds_def in self._configuration:
-            # Extract variables
-            ds_strat = ds_def['from']
-            ds_args = ds_def['args']
-            ds_name = ds_def['name']
-
-            strategy = ds_strat
-
-            if strategy == DataSetLoader.STRATEGY.SOURCE:
-                m = {
-                    NetboxSource: DataSetLoader.STRATEGY.NETBOX_SOURCE,
-                    FileSource: DataSetLoader.STRATEGY.FILE_SOURCE,
-                    ScriptSource: DataSetLoader.STRATEGY.FILE_SOURCE
+    class Transform:
+        TRANSFORM_SECTION = {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "$id": "http://example.com/product.schema.json",
+            "type": "array",
+            "items": {
+                "type": "object",
+                "additionalProperties": False,
+                "required": ["module", "func"],
+                "properties": {
+                    "module": {
+                        "type": "string",
+                        "minLength": 1
+                    },
+                    "func": {
+                        "type": "string",
+                        "minLength": 1
+                    }
                 }
-                try:
-                    src_name = ds_args['name']
-                except KeyError as err:
-                    raise YaaniError(
-                        "Missing key '{}' in data sets '{}' creation "
-                        "arguments.\n"
-                        .format(err.args[0], ds_name)
-                    )
-                try:
-                    strategy = m[type(sources.get(src_name))]
-                except KeyError as err:
-                    raise YaaniError(
-                        "The source name '{}' refers to an undeclared "
-                        "source. Please make sure this source is "
-                        "declared in the 'data_sources' section."
-                        .format(src_name)
-                    )
-            # Validate data set arguments
-            Validator.DataSets.validate_data_set_args(
-                strategy,
-                ds_args
-            )
+            }
+        }
+
+        TRANSFORM_VALIDATOR = Draft7Validator(TRANSFORM_SECTION)
 
-            # Actually create the data set and place it in the proper place
+        @staticmethod
+        def validate_configuration(configuration):
             try:
-                data_sets[ds_name] = DataSetLoader.Utils.create_set(
-                    strategy=ds_strat,
-                    args=ds_args,
-                    sources=sources,
-                    data_sets=data_sets
+                Validator.Transform.TRANSFORM_VALIDATOR.validate(
+                    configuration
                 )
-            except YaaniError as err:
+            except ValidationError as err:
                 raise YaaniError(
-                    "Could not create data set '{}':\n{}"
-                    .format(ds_name, str(err))
+                    "The configuration file parsing failed due to an error in "
+                    "the 'transform' section: \n{}\n{}".format(
+                        err.instance, err.message
+                    )
                 )
 
-        return data_sets
-
 
 class InventoryRenderer:
     """Inventory Builder is the object that builds and return the inventory.
@@ -1061,7 +1208,7 @@ class InventoryRenderer:
         @staticmethod
         def apply_condition(cnd_value, elt_list, rndrd_ns=False):
             tmp_dct = {id(elt): elt for elt in elt_list}
-            query = "[ .[] | select(.[1]{}) | .[0] ]".format(cnd_value)
+            query = CONDITION_QUERY_TEMPLATE.format(cnd_value)
 
             if rndrd_ns:
                 tstd_lst = [(uid, elt[1]) for uid, elt in tmp_dct.items()]
@@ -1069,10 +1216,7 @@ class InventoryRenderer:
                 tstd_lst = [(uid, elt[0]) for uid, elt in tmp_dct.items()]
 
             try:
-                mtchng_ids = pyjq.first(
-                    query,
-                    tstd_lst
-                )
+                mtchng_ids = compile_query(query).first(tstd_lst)
             except ValueError as err:
                 raise YaaniError(
                     "The given query '{}' seems to be incorrect.\n"
@@ -1084,23 +1228,26 @@ class InventoryRenderer:
 
         @staticmethod
         def render_host_vars(config, data_set):
+            # If no vars were specified, render all host vars. A plain
+            # top-level merge of the import namespace gives the same
+            # result as the jq identity program without the round-trip
+            if len(config) == 0:
+                for elt in data_set:
+                    elt[1].update(elt[0])
+                return data_set
+
             tmp_dct = {
                 id(elt): elt for elt in data_set
             }
 
-            # If no vars were specified, render all host vars
-            if len(config) == 0:
-                query = "[ .[] | [.[0], (.[1]) ] ]"
-            else:
-                acc = ""
-                for var, vardf in config.items():
-                    acc += "{}: ({}), ".format(var, vardf)
-                acc = acc[:-2]
-                query = "[ .[] | [.[0], (.[1] | {%s}) ]]" % (acc)
+            acc = ""
+            for var, vardf in config.items():
+                acc += "{}: ({}), ".format(var, vardf)
+            acc = acc[:-2]
+            query = HOST_VARS_QUERY_TEMPLATE % (acc)
 
             try:
-                comptd = pyjq.first(
-                    query,
+                comptd = compile_query(query).first(
                     [(uid, elt[0]) for uid, elt in tmp_dct.items()]
                 )
             except ValueError as err:
@@ -1110,7 +1257,7 @@ class InventoryRenderer:
                 )
 
             try:
-                for uid, rndrd in [tuple(e) for e in comptd]:
+                for uid, rndrd in comptd:
                     tmp_dct[uid][1].update(rndrd)
             except ValueError as err:
                 raise YaaniError(
@@ -1143,22 +1290,35 @@ class InventoryRenderer:
                     "The 'value' key is mandatory in index config.\n"
                 )
 
-            try:
-                mpng_uid_indx = pyjq.first(
-                    "[ .[] | [.[0], (.[1]{})] ]".format(value),
-                    [
-                        (uid, elt[i])
+            # Plain dotted-path index queries, the common case, are
+            # resolved with a simple dict walk instead of the jq engine
+            keys = simple_key_path(value)
+            mpng_uid_indx = None
+            if keys is not None:
+                try:
+                    mpng_uid_indx = [
+                        (uid, walk_key_path(keys, elt[i]))
                         for uid, elt in tmp_dct.items()
                     ]
-                )
-            except ValueError as err:
-                raise YaaniError(
-                    "The given query '{}' seems to be incorrect.\n"
-                    .format(value)
-                )
+                except TypeError:
+                    # Exotic data: let jq raise its own error
+                    mpng_uid_indx = None
+            if mpng_uid_indx is None:
+                try:
+                    mpng_uid_indx = compile_query(
+                        INDEX_QUERY_TEMPLATE.format(value)
+                    ).first([
+                        (uid, elt[i])
+                        for uid, elt in tmp_dct.items()
+                    ])
+                except ValueError as err:
+                    raise YaaniError(
+                        "The given query '{}' seems to be incorrect.\n"
+                        .format(value)
+                    )
 
             result = {}
-            for uid, indx in map(lambda x: tuple(x), mpng_uid_indx):
+            for uid, indx in mpng_uid_indx:
                 if indx:
                     if isinstance(indx, list) or isinstance(indx, dict):
                         raise YaaniError(
@@ -1251,7 +1411,6 @@ class InventoryRenderer:
                     elt=elt,
                     ds_name=ds_name,
                     inventory=inventory,
-                    rdr_opts=rdr_opts,
                 )
 
             # Execute group_by
@@ -1271,8 +1430,7 @@ class InventoryRenderer:
                 )
 
         @staticmethod
-        def add_element_to_inventory(elt_idx, elt, ds_name,
-                                     inventory, rdr_opts={}):
+        def add_element_to_inventory(elt_idx, elt, ds_name, inventory):
             # Load the host vars in the inventory
             InventoryRenderer.Utils.load_element_vars(
                 element_index=elt_idx,
@@ -1302,64 +1460,90 @@ class InventoryRenderer:
         @staticmethod
         def render_group_by(indexed_data_set, group_by, group_prefix,
                             inventory):
-            # If the group_by option is specified, insert the element in the
-            # propper groups.
-            if group_by:
-                # Build the query
-                acc = ""
-                for grp_def in group_by:
-                    if grp_def.get("namespace", "import") == "build":
-                        index = 1
-                    else:
-                        index = 0
-                    acc += "(.[{}]{}), ".format(index, grp_def["value"])
-                acc = acc[:-2]
-                query = "[ .[] | [.[0], (.[1] | [{}] | flatten)]]".format(acc)
-                # Extract the mapping uid / [groups]
-                try:
-                    mpng = pyjq.first(
-                        query,
-                        list(indexed_data_set.items())
-                    )
-                except ValueError as err:
-                    raise YaaniError(
-                        "One of the given query seems to be incorrect: {}\n"
-                        .format([e["value"] for e in group_by])
-                    )
+            # Nothing to group on
+            if not group_by:
+                return inventory
+
+            # Build one selector per group definition. The whole plan is
+            # folded into a single jq program, so every group value of
+            # every element is resolved in one pass over the data set
+            selectors = [
+                "(.[{}]{})".format(
+                    1 if grp_def.get("namespace", "import") == "build" else 0,
+                    grp_def["value"]
+                )
+                for grp_def in group_by
+            ]
+            query = GROUP_BY_QUERY_TEMPLATE.format(", ".join(selectors))
+            # Extract the mapping uid / [groups]
+            try:
+                mpng = compile_query(query).first(
+                    list(indexed_data_set.items())
+                )
+            except ValueError as err:
+                raise YaaniError(
+                    "One of the given query seems to be incorrect: {}\n"
+                    .format([e["value"] for e in group_by])
+                )
 
-                # Execute grouping
-                for indx, groups in mpng:
-                    for group in groups:
-                        if group is not None:
-                            InventoryRenderer.Utils.add_element_to_group(
-                                element_name=indx,
-                                group_name=group_prefix + str(group),
-                                inventory=inventory
-                            )
+            # Execute grouping
+            for indx, groups in mpng:
+                for group in groups:
+                    if group is not None:
+                        InventoryRenderer.Utils.add_element_to_group(
+                            element_name=indx,
+                            group_name=group_prefix + str(group),
+                            inventory=inventory
+                        )
 
             return inventory
 
         @staticmethod
         def add_element_to_group(element_name, group_name, inventory):
-            inventory = InventoryRenderer.Utils.init_ansible_group(
-                group_name=group_name,
-                inventory=inventory
-            )
-            if (
-                element_name not in
-                inventory.get(group_name, {}).get('hosts', [])
-            ):
-                inventory[group_name]['hosts'].append(element_name)
+            # This runs for every element / group pair, so the group
+            # initialization is inlined instead of delegated to
+            # init_ansible_group and the existing-group case stays a
+            # couple of dict lookups
+            group = inventory.get(group_name)
+            if group is None:
+                group = inventory[group_name] = {
+                    'hosts': [],
+                    'vars': {},
+                    'children': [],
+                    '_hosts_set': set(),
+                }
+            hosts_set = group.get('_hosts_set')
+            if hosts_set is None:
+                # The group was built outside of this helper (group
+                # vars, group hierarchy): seed its membership index
+                hosts_set = group['_hosts_set'] = set(group['hosts'])
+            if element_name not in hosts_set:
+                hosts_set.add(element_name)
+                group['hosts'].append(element_name)
             return inventory
 
         @staticmethod
         def init_ansible_group(group_name, inventory):
             # Initialize the group in the inventory
-            inventory.setdefault(group_name, {})
+            group = inventory.setdefault(group_name, {})
             # Initialize the host field of the group
-            inventory[group_name].setdefault('hosts', [])
-            inventory[group_name].setdefault('vars', {})
-            inventory[group_name].setdefault('children', [])
+            group.setdefault('hosts', [])
+            group.setdefault('vars', {})
+            group.setdefault('children', [])
+            # Membership index mirroring 'hosts'. It keeps the insertion
+            # test O(1) and is stripped before the inventory is emitted
+            if '_hosts_set' not in group:
+                group['_hosts_set'] = set(group['hosts'])
+            return inventory
+
+        @staticmethod
+        def strip_host_sets(inventory):
+            """Remove the '_hosts_set' membership indexes so the emitted
+            inventory keeps the plain Ansible dynamic inventory shape.
+            """
+            for group in inventory.values():
+                if isinstance(group, dict):
+                    group.pop('_hosts_set', None)
             return inventory
 
         @staticmethod
@@ -1445,7 +1629,7 @@ class InventoryRenderer:
                 inventory=inventory
             )
 
-        return inventory
+        return InventoryRenderer.Utils.strip_host_sets(inventory)
 
 # ****************************************************************************
 # *                                DataSources                               *
@@ -1480,7 +1664,7 @@ class TextSource(FullSetSource):
         self._path = args['path']
         self._content_type = args['content_type']
         if self._content_type.lower() == 'yaml':
-            self._loading_method = yaml.safe_load
+            self._loading_method = yaml_safe_load
             self._dumping_method = yaml.dump
         elif self._content_type.lower() == 'json':
             self._loading_method = json.load
@@ -1527,7 +1711,7 @@ class TextSource(FullSetSource):
 
     def filter(self, query):
         try:
-            return pyjq.all(query, self._dataset)
+            return compile_query(query).all(self._dataset)
         except ValueError as err:
             raise YaaniError(
                 "Jq could not compile the following query: {}\n{}\n"
@@ -1553,7 +1737,7 @@ class ScriptSource(TextSource):
         self._path = args['path']
         self._content_type = args['content_type']
         if self._content_type.lower() == 'yaml':
-            self._loading_method = yaml.safe_load
+            self._loading_method = yaml_safe_load
             self._dumping_method = yaml.dump
         elif self._content_type.lower() == 'json':
             self._loading_method = json.loads
@@ -1599,8 +1783,33 @@ class ScriptSource(TextSource):
 class NetboxSource(PartialSetSource):
     def __init__(self, args):
         self._api = pynetbox.api(**args)
+        self._endpoints = {}
+
+    def endpoint(self, nb_app, nb_type):
+        """Return the pynetbox endpoint for the given application and
+        object type, resolving each (app, type) pair only once since
+        every getattr on the api lazily builds a new wrapper object.
+        """
+        key = (nb_app, nb_type)
+        if key not in self._endpoints:
+            self._endpoints[key] = getattr(
+                getattr(self._api, nb_app), nb_type
+            )
+        return self._endpoints[key]
 
     def extract(self, args):
+        """Extract a list of elements from Netbox.
+
+        The pynetbox result sets are paginating generators: they are
+        consumed lazily, one record at a time, so the HTTP fetches
+        overlap with the record-to-dict conversion and each element is
+        materialized exactly once, straight into the returned
+        collection. Do not wrap them in intermediate lists.
+
+        Args:
+            args (dict): The extraction arguments (app, type and the
+                optional filters and brief options)
+        """
         try:
             nb_app = args["app"].lower().replace("-", "_")
             nb_type = args["type"].lower().replace("-", "_")
@@ -1611,19 +1820,27 @@ class NetboxSource(PartialSetSource):
                 .format(err.args[0])
             )
 
-        endpoint = getattr(getattr(self._api, nb_app), nb_type)
+        endpoint = self.endpoint(nb_app, nb_type)
+
+        # Asking Netbox for its brief serialization drastically cuts the
+        # payload size when only top level fields are used afterwards
+        brief_args = {"brief": 1} if args.get("brief") else {}
 
         collection = []
         try:
             if "filters" in args:
-                seen_id = []
+                seen_id = set()
                 for filter_args in args['filters']:
-                    for elt in endpoint.filter(**filter_args):
+                    for elt in endpoint.filter(
+                        **dict(filter_args, **brief_args)
+                    ):
                         # Add the element to collection only if it is not
                         # already in
                         if elt.id not in seen_id:
-                            seen_id.append(elt.id)
+                            seen_id.add(elt.id)
                             collection.append(dict(elt))
+            elif brief_args:
+                collection = [dict(e) for e in endpoint.filter(**brief_args)]
             else:
                 collection = [dict(e) for e in endpoint.all()]
         except pynetbox.core.query.RequestError as err:
@@ -1698,7 +1915,7 @@ class Utils:
         """
         try:
             with open(config_file_path, 'r') as file:
-                parsed_config = yaml.safe_load(file)
+                parsed_config = yaml_safe_load(file)
         except IOError:
             # Handle file level exception
             raise YaaniError(
@@ -1721,7 +1938,17 @@ class Utils:
         Args:
                 inventory (dict): The inventory
         """
-        print(json.dumps(inventory))
+        if orjson is not None:
+            # Non-string hostvar keys (e.g. an integer index query such
+            # as ".id") must be coerced to strings like json.dumps does
+            print(
+                orjson.dumps(
+                    inventory,
+                    option=orjson.OPT_NON_STR_KEYS
+                ).decode("utf-8")
+            )
+        else:
+            print(json.dumps(inventory))
 
     @staticmethod
     def transform_inventory(render_configuration, inventory):
@@ -1734,6 +1961,7 @@ class Utils:
         """
         if render_configuration:
             func_array = []
+            loaded_modules = {}
             for fdef in render_configuration:
                 try:
                     custom_module_name = fdef['module']
@@ -1745,30 +1973,39 @@ class Utils:
                         .format(err.args[0])
                     )
 
-                try:
-                    # Define a default dir for custom modules
-                    default_dir = os.getcwd() + "/modules"
-                    # Select the proper modules dir
-                    mod_dir = os.getenv(DEFAULT_ENV_MODULES_DIR, default_dir)
-                    # Build full modules path
-                    module_path = "%s/%s.py" % (mod_dir, custom_module_name)
-                    spec = importlib.util.spec_from_file_location(
-                        custom_module_name, module_path
-                    )
-                    custom_module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(custom_module)
-                except ImportError as err:
-                    raise YaaniError(
-                        "The import of the custome module '{}' failed.\n"
-                        "{}"
-                        .format(custom_module_name, str(err))
-                    )
-                except FileNotFoundError as err:
-                    raise YaaniError(
-                        "The import of the custome module '{}' failed.\n"
-                        "{}"
-                        .format(custom_module_name, str(err))
-                    )
+                # A module is loaded and executed only once, however
+                # many of its functions are configured
+                custom_module = loaded_modules.get(custom_module_name)
+                if custom_module is None:
+                    try:
+                        # Define a default dir for custom modules
+                        default_dir = os.getcwd() + "/modules"
+                        # Select the proper modules dir
+                        mod_dir = os.getenv(
+                            DEFAULT_ENV_MODULES_DIR, default_dir
+                        )
+                        # Build full modules path
+                        module_path = "%s/%s.py" % (
+                            mod_dir, custom_module_name
+                        )
+                        spec = importlib.util.spec_from_file_location(
+                            custom_module_name, module_path
+                        )
+                        custom_module = importlib.util.module_from_spec(spec)
+                        spec.loader.exec_module(custom_module)
+                    except ImportError as err:
+                        raise YaaniError(
+                            "The import of the custome module '{}' failed.\n"
+                            "{}"
+                            .format(custom_module_name, str(err))
+                        )
+                    except FileNotFoundError as err:
+                        raise YaaniError(
+                            "The import of the custome module '{}' failed.\n"
+                            "{}"
+                            .format(custom_module_name, str(err))
+                        )
+                    loaded_modules[custom_module_name] = custom_module
 
                 try:
                     custom_func = getattr(custom_module, func_name)
@@ -1818,6 +2055,19 @@ def cli(cli_argv):
     except YaaniError as err:
         Utils.exit(err, 1)
 
+    # Host mode always renders an empty inventory: skip the source and
+    # data set loading entirely instead of fetching data for nothing
+    if args['host'] is not None and not args['list']:
+        try:
+            # Print the JSON formatted inventory dict
+            Utils.transform_inventory(
+                configuration.get('transform', []),
+                InventoryRenderer.Utils.init_inventory()
+            )
+        except YaaniError as err:
+            Utils.exit(err, 5)
+        return
+
     # Load data sources ------------------------------------------------------
     try:
         src_ldr = SourceLoader(configuration=configuration["data_sources"])